@@ -0,0 +1,48 @@
+"""Convert string UUID columns to native Postgres uuid
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (table, columns) pairs holding UUID values stored as varchar/text
+_UUID_COLUMNS = [
+    ("users", ["id"]),
+    ("patient_profiles", ["id", "user_id"]),
+    ("researcher_profiles", ["id", "user_id"]),
+    ("clinical_trials", ["id", "researcher_id"]),
+    ("publications", ["id", "researcher_id"]),
+    ("health_experts", ["id"]),
+    ("forum_categories", ["id"]),
+    ("forum_posts", ["id", "category_id", "author_id"]),
+    ("forum_replies", ["id", "post_id", "author_id"]),
+    ("favorites", ["id", "user_id", "item_id"]),
+    ("meeting_requests", ["id", "patient_id", "expert_id"]),
+    ("connections", ["id", "requester_id", "receiver_id"]),
+]
+
+
+def upgrade() -> None:
+    for table, columns in _UUID_COLUMNS:
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE uuid USING {column}::uuid"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in _UUID_COLUMNS:
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE varchar USING {column}::text"
+            )
@@ -0,0 +1,39 @@
+"""GIN indexes on searchable array columns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+_GIN_INDEXES = [
+    ("ix_patient_profiles_conditions_gin", "patient_profiles", "conditions"),
+    ("ix_researcher_profiles_specialties_gin", "researcher_profiles", "specialties"),
+    ("ix_researcher_profiles_interests_gin", "researcher_profiles", "research_interests"),
+    ("ix_publications_authors_gin", "publications", "authors"),
+    ("ix_publications_keywords_gin", "publications", "keywords"),
+    ("ix_health_experts_specialties_gin", "health_experts", "specialties"),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, column in _GIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING GIN ({column})"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _column in _GIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
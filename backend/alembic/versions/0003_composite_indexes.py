@@ -0,0 +1,47 @@
+"""Composite and covering indexes for hot filter/sort paths
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+_STATEMENTS = [
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trials_condition_status_created "
+    "ON clinical_trials (condition, status, created_at) INCLUDE (title)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_forum_posts_category_created "
+    "ON forum_posts (category_id, created_at)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_forum_posts_author_created "
+    "ON forum_posts (author_id, created_at)",
+    "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_favorites_user_item "
+    "ON favorites (user_id, item_type, item_id)",
+    "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meeting_requests_expert_status "
+    "ON meeting_requests (expert_id, status)",
+]
+
+_INDEX_NAMES = [
+    "ix_trials_condition_status_created",
+    "ix_forum_posts_category_created",
+    "ix_forum_posts_author_created",
+    "ix_favorites_user_item",
+    "ix_meeting_requests_expert_status",
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for statement in _STATEMENTS:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in _INDEX_NAMES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,51 @@
+"""Move enum columns to native Postgres ENUM types
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+_ENUM_TYPES = {
+    "user_type": ["patient", "researcher"],
+    "trial_status": ["recruiting", "completed", "active", "suspended"],
+    "request_status": ["pending", "approved", "rejected", "accepted"],
+    "item_type": ["trial", "publication", "expert", "collaborator"],
+}
+
+_ENUM_COLUMNS = [
+    ("users", "user_type", "user_type"),
+    ("clinical_trials", "status", "trial_status"),
+    ("forum_posts", "author_type", "user_type"),
+    ("favorites", "item_type", "item_type"),
+    ("meeting_requests", "status", "request_status"),
+    ("connections", "status", "request_status"),
+]
+
+
+def upgrade() -> None:
+    for name, values in _ENUM_TYPES.items():
+        quoted = ", ".join(f"'{v}'" for v in values)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({quoted})")
+    for table, column, enum_name in _ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_name} USING lower({column}::text)::{enum_name}"
+        )
+
+
+def downgrade() -> None:
+    for table, column, _enum_name in _ENUM_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE varchar USING {column}::text"
+        )
+    for name in _ENUM_TYPES:
+        op.execute(f"DROP TYPE IF EXISTS {name}")
@@ -0,0 +1,36 @@
+"""Drop the denormalized forum_posts.author_type column
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_column("forum_posts", "author_type")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "forum_posts",
+        sa.Column(
+            "author_type",
+            postgresql.ENUM(name="user_type", create_type=False),
+            nullable=True,
+        ),
+    )
+    op.execute(
+        "UPDATE forum_posts SET author_type = users.user_type "
+        "FROM users WHERE users.id = forum_posts.author_id"
+    )
+    op.alter_column("forum_posts", "author_type", nullable=False)
@@ -0,0 +1,52 @@
+"""Make updated_at non-null with a server default
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+_TABLES = [
+    "users",
+    "patient_profiles",
+    "researcher_profiles",
+    "clinical_trials",
+    "publications",
+    "health_experts",
+    "forum_categories",
+    "forum_posts",
+    "forum_replies",
+    "meeting_requests",
+    "connections",
+]
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(
+            f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT now(), "
+            f"ALTER COLUMN updated_at SET NOT NULL"
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_trials_updated_at "
+        "ON clinical_trials (updated_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_trials_updated_at")
+    for table in _TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN updated_at DROP DEFAULT, "
+            f"ALTER COLUMN updated_at DROP NOT NULL"
+        )
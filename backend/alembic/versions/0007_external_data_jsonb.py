@@ -0,0 +1,35 @@
+"""health_experts.external_data to jsonb with a GIN index
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE health_experts ALTER COLUMN external_data "
+        "TYPE jsonb USING external_data::jsonb"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_health_experts_external_gin "
+            "ON health_experts USING GIN (external_data jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_health_experts_external_gin")
+    op.execute(
+        "ALTER TABLE health_experts ALTER COLUMN external_data "
+        "TYPE json USING external_data::json"
+    )
@@ -0,0 +1,52 @@
+"""Generated tsvector columns and GIN indexes for keyword search
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = [
+    (
+        "clinical_trials",
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))",
+    ),
+    (
+        "publications",
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(abstract, ''))",
+    ),
+]
+
+_INDEXES = [
+    ("ix_trials_search_tsv", "clinical_trials"),
+    ("ix_publications_search_tsv", "publications"),
+]
+
+
+def upgrade() -> None:
+    for table, expression in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_tsv tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING GIN (search_tsv)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table in _INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    for table, _expression in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_tsv")
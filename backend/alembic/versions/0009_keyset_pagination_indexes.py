@@ -0,0 +1,36 @@
+"""Composite (created_at, id) indexes backing keyset pagination
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-11-02
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+_INDEXES = [
+    ("ix_trials_created_id", "clinical_trials"),
+    ("ix_publications_created_id", "publications"),
+    ("ix_researcher_profiles_created_id", "researcher_profiles"),
+    ("ix_health_experts_created_id", "health_experts"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in _INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} (created_at, id)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table in _INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,48 @@
+"""
+Redis cache for rendered API responses
+
+Detail endpoints for trials and publications are read-dominant and
+keyed by a stable id; serving repeats from Redis replaces a Postgres
+query plus ORM hydration and Pydantic serialization with one sub-ms
+GET. Entries carry a short TTL and writers invalidate their key, so
+staleness is bounded either way.
+"""
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.config import get_settings
+
+
+class ResponseCache:
+    """Serialized response bodies in Redis; unavailability degrades to
+    rendering from the database as if the cache were cold."""
+
+    def __init__(self, url: str, ttl: int):
+        self._redis = aioredis.from_url(url)
+        self._ttl = ttl
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self._redis.get(key)
+        except RedisError:
+            return None
+
+    async def set(self, key: str, payload: bytes, ttl: Optional[int] = None) -> None:
+        try:
+            await self._redis.set(key, payload, ex=ttl or self._ttl)
+        except RedisError:
+            pass
+
+    async def invalidate(self, key: str) -> None:
+        try:
+            await self._redis.delete(key)
+        except RedisError:
+            pass
+
+
+response_cache = ResponseCache(
+    get_settings().REDIS_URL,
+    get_settings().RESPONSE_CACHE_TTL,
+)
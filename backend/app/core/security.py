@@ -1,19 +1,202 @@
 """
 Security utilities for authentication and authorization
 """
+import asyncio
+import hashlib
+import json
+import time
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import redis.asyncio as aioredis
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from app.core.config import settings
-from app.db.session import get_db
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import get_settings
+from app.db.session import AsyncSessionLocal, get_async_db
 import app.models.models as models
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: argon2id for new hashes, bcrypt kept so existing
+# hashes still verify; CryptContext re-hashes those on next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,  # 64 MiB
+    argon2__parallelism=2,
+    bcrypt__rounds=get_settings().PASSWORD_HASH_ROUNDS,
+)
 
 # OAuth2 scheme
-oauth2_scheme = OAuth2
\ No newline at end of file
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+
+# HMAC key built once; passing the raw secret string to jwt.encode/decode
+# re-derives the key object (and re-encodes the secret) on every call
+_SIGNING_KEY = jwk.construct(get_settings().SECRET_KEY, get_settings().ALGORITHM)
+
+
+class TokenCache:
+    """Redis cache of decoded JWT claims, keyed by SHA-256 of the raw token.
+
+    One Redis GET replaces the HMAC verification + base64/JSON decode that
+    jose would otherwise redo for every request carrying the same token.
+    Entries expire with the token, and Redis being unavailable degrades to
+    a normal local decode.
+    """
+
+    def __init__(self, url: str):
+        self._redis = aioredis.from_url(url, decode_responses=True)
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return "jwt:" + hashlib.sha256(token.encode()).hexdigest()
+
+    async def get(self, token: str) -> Optional[dict]:
+        try:
+            value = await self._redis.get(self._key(token))
+        except RedisError:
+            return None
+        return json.loads(value) if value else None
+
+    async def set(self, token: str, payload: dict) -> None:
+        ttl = int(payload.get("exp", 0) - time.time())
+        if ttl <= 0:
+            return
+        try:
+            await self._redis.set(self._key(token), json.dumps(payload), ex=ttl)
+        except RedisError:
+            pass
+
+    async def invalidate(self, token: str) -> None:
+        """Drop a token's cached claims (e.g. on logout)"""
+        try:
+            await self._redis.delete(self._key(token))
+        except RedisError:
+            pass
+
+
+token_cache = TokenCache(get_settings().REDIS_URL)
+
+# Verified against when a login email doesn't exist, so unknown and known
+# accounts take the same time to reject; skipping the hash for unknown
+# emails would leak account existence through response latency.
+DUMMY_PASSWORD_HASH = pwd_context.hash("curalink-dummy-password")
+
+# Per-worker cache of authenticated User rows keyed by token subject.
+# Nearly every endpoint depends on get_current_user, so without this each
+# request pays a SELECT for a row that changes rarely; 60s TTL bounds how
+# long a stale row can be served. Instances stay usable detached because
+# sessions are created with expire_on_commit=False and the profile
+# relationships load eagerly with the row.
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def invalidate_user_cache(email: str) -> None:
+    """Drop a user's cached row after a write that changes it (e.g.
+    profile creation), so the next request re-reads from the database
+    instead of serving the stale row for up to the TTL."""
+    _user_cache.pop(email, None)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against its hash"""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """Hash a password for storage"""
+    return pwd_context.hash(password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """verify_password offloaded to a worker thread.
+
+    Password hashing is deliberately slow, CPU-bound work; running it
+    inline in an async handler would stall the event loop for every
+    other in-flight request.
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """get_password_hash offloaded to a worker thread"""
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when the stored hash uses a deprecated scheme or weaker
+    parameters than the context currently mandates"""
+    return pwd_context.needs_update(hashed_password)
+
+
+async def rehash_and_store(user_id, password: str) -> None:
+    """Re-hash a just-verified password with current parameters.
+
+    Runs as a fire-and-forget task after a successful login so stored
+    hashes upgrade (legacy bcrypt -> argon2, or old cost -> new cost)
+    without adding a second slow hash to the login response path.
+    """
+    new_hash = await aget_password_hash(password)
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(models.User)
+            .where(models.User.id == user_id)
+            .values(hashed_password=new_hash)
+        )
+        await session.commit()
+
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    """Create a signed JWT access token"""
+    settings = get_settings()
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode.update({"exp": expire})
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> models.User:
+    """Decode the JWT (cache-first) and load the matching user"""
+    settings = get_settings()
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    payload = await token_cache.get(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, _SIGNING_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            raise credentials_exception
+        await token_cache.set(token, payload)
+    email: Optional[str] = payload.get("sub")
+    if email is None:
+        raise credentials_exception
+
+    user = _user_cache.get(email)
+    if user is None:
+        user = (await db.execute(
+            select(models.User).where(models.User.email == email)
+        )).scalar_one_or_none()
+        if user is None:
+            raise credentials_exception
+        _user_cache[email] = user
+    return user
+
+
+def get_current_active_user(
+    current_user: models.User = Depends(get_current_user)
+) -> models.User:
+    """Return the authenticated user for route dependencies"""
+    return current_user
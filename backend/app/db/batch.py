@@ -0,0 +1,121 @@
+"""
+Coalescing write-back queue for high-churn inserts
+
+Every per-request commit forces a WAL fsync on the database. Forum
+posts and replies tolerate their row landing a few milliseconds later,
+so handlers hand rows to a single writer task that drains the queue and
+commits up to a whole batch in one INSERT ... VALUES (...), (...)
+RETURNING transaction - N requests, one fsync. Auth and profile writes
+must stay synchronous and do not go through here.
+"""
+import asyncio
+
+from fastapi import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from uuid6 import uuid7
+
+from app.db.session import AsyncSessionLocal
+
+
+class InsertBatcher:
+    """Batch single-row inserts of one model behind an asyncio.Queue.
+
+    Handlers await insert(); the writer task collects up to max_batch
+    rows or max_delay seconds, runs one multi-VALUES insert, and
+    resolves each caller's future with its returned ORM row. Ids are
+    assigned client-side before enqueueing so returned rows are matched
+    back to callers by primary key - Postgres does not guarantee
+    RETURNING order for multi-VALUES inserts.
+    """
+
+    def __init__(self, model, max_batch: int = 100, max_delay: float = 0.005):
+        self._model = model
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def insert(self, values: dict):
+        """Enqueue one row and wait for its inserted ORM instance"""
+        values.setdefault("id", uuid7())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((values, future))
+        return await future
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_delay
+        while len(batch) < self._max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _insert_one(self, values: dict):
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                insert(self._model).values(values).returning(self._model)
+            )
+            row = result.scalar_one()
+            await session.commit()
+            return row
+
+    async def _fallback(self, batch: list) -> None:
+        """Retry a failed batch row by row so one bad row fails only its
+        own caller instead of every co-batched request."""
+        for values, future in batch:
+            if future.done():
+                continue
+            try:
+                row = await self._insert_one(values)
+            except asyncio.CancelledError:
+                raise
+            except IntegrityError:
+                future.set_exception(HTTPException(
+                    status_code=400,
+                    detail="Request references missing or conflicting data",
+                ))
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(row)
+
+    async def _drain(self) -> None:
+        while True:
+            batch = await self._collect()
+            rows = [values for values, _future in batch]
+            try:
+                async with AsyncSessionLocal() as session:
+                    result = await session.execute(
+                        insert(self._model).values(rows).returning(self._model)
+                    )
+                    inserted = result.scalars().all()
+                    await session.commit()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                await self._fallback(batch)
+                continue
+            rows_by_id = {row.id: row for row in inserted}
+            for values, future in batch:
+                if not future.done():
+                    future.set_result(rows_by_id[values["id"]])
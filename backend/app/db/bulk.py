@@ -0,0 +1,42 @@
+"""
+Batch upsert helpers for external data ingestion
+
+Syncing from ClinicalTrials.gov or PubMed through the ORM unit-of-work
+costs one INSERT (plus a SELECT) per record. These helpers send a whole
+batch as a single INSERT ... ON CONFLICT DO UPDATE statement, letting
+Postgres dedupe on the unique ingest key server-side in one round-trip.
+"""
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.models import ClinicalTrial, Publication
+
+# columns never overwritten on re-ingest
+_PRESERVED = ("id", "created_at")
+
+
+def _upsert_stmt(model, rows: list[dict], conflict_col: str):
+    stmt = pg_insert(model).values(rows)
+    # SET only what the batch actually carries: columns absent from the
+    # rows (researcher_id, ai_summary, ...) keep their stored values
+    # instead of being nulled by EXCLUDED, and generated columns like
+    # search_tsv - which Postgres forbids updating - never appear
+    update_cols = {
+        key: stmt.excluded[key]
+        for key in rows[0]
+        if key not in _PRESERVED and key != conflict_col
+    }
+    return stmt.on_conflict_do_update(index_elements=[conflict_col], set_=update_cols)
+
+
+async def bulk_upsert_trials(session, rows: list[dict]) -> None:
+    """Insert-or-update a batch of clinical trials keyed on nct_id"""
+    if not rows:
+        return
+    await session.execute(_upsert_stmt(ClinicalTrial, rows, "nct_id"))
+
+
+async def bulk_upsert_publications(session, rows: list[dict]) -> None:
+    """Insert-or-update a batch of publications keyed on pubmed_id"""
+    if not rows:
+        return
+    await session.execute(_upsert_stmt(Publication, rows, "pubmed_id"))
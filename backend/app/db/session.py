@@ -1,16 +1,50 @@
-from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async engine for the request path: asyncpg speaks the Postgres binary
+# protocol from C and yields the event loop during I/O instead of blocking
+# a threadpool worker per query.
+async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.SQLALCHEMY_POOL_SIZE,
+    max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+    pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+    pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+    pool_pre_ping=settings.SQLALCHEMY_POOL_PRE_PING,
+    # the app issues a stable set of query shapes, so cache their compiled
+    # SQL and let asyncpg keep server-side prepared statements warm
+    query_cache_size=settings.SQLALCHEMY_QUERY_CACHE_SIZE,
+    connect_args={
+        "statement_cache_size": settings.ASYNCPG_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.ASYNCPG_STATEMENT_CACHE_SIZE,
+    },
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+
+async def get_async_db() -> AsyncSession:
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def prewarm_pool() -> None:
+    """Open every pooled connection once at startup.
+
+    The pool is fixed-size (max_overflow=0), so holding pool_size
+    connections concurrently forces them all to be established up front;
+    the first requests then never pay TCP/TLS + auth latency.
+    """
+
+    conns = []
     try:
-        yield db
+        for _ in range(settings.SQLALCHEMY_POOL_SIZE):
+            conn = await async_engine.connect()
+            await conn.execute(text("SELECT 1"))
+            conns.append(conn)
     finally:
-        db.close()
\ No newline at end of file
+        for conn in conns:
+            await conn.close()
@@ -1,13 +1,11 @@
-from sqlalchemy import Boolean, Column, String, Text, DateTime, ForeignKey, Table, ARRAY, JSON, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Computed, Index, String, Text, DateTime, ForeignKey, Table, ARRAY
+from sqlalchemy.dialects.postgresql import ENUM as PGEnum, JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from app.db.session import Base
-import uuid
+from uuid6 import uuid7
 import enum
 
-def generate_uuid():
-    return str(uuid.uuid4())
-
 class UserType(str, enum.Enum):
     PATIENT = "patient"
     RESEARCHER = "researcher"
@@ -30,34 +28,54 @@ class ItemType(str, enum.Enum):
     EXPERT = "expert"
     COLLABORATOR = "collaborator"
 
+def _enum_values(enum_cls):
+    return [member.value for member in enum_cls]
+
+# Native Postgres ENUM types: 4 bytes on disk, compared by OID, and
+# values_callable skips the Python name->value mapping on bulk writes
+user_type_enum = PGEnum(UserType, name="user_type", values_callable=_enum_values)
+trial_status_enum = PGEnum(TrialStatus, name="trial_status", values_callable=_enum_values)
+request_status_enum = PGEnum(RequestStatus, name="request_status", values_callable=_enum_values)
+item_type_enum = PGEnum(ItemType, name="item_type", values_callable=_enum_values)
+
 # Users Table
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(String, primary_key=True, default=generate_uuid)
-    email = Column(String, unique=True, index=True, nullable=False)
-    hashed_password = Column(String, nullable=False)
-    user_type = Column(SQLEnum(UserType), nullable=False)
+    # fetch server-generated defaults via INSERT ... RETURNING, not a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    email = Column(String(254), unique=True, index=True, nullable=False)
+    hashed_password = Column(String(255), nullable=False)
+    user_type = Column(user_type_enum, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    patient_profile = relationship("PatientProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
-    researcher_profile = relationship("ResearcherProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    # selectin: one IN-query per relationship instead of one query per user row
+    patient_profile = relationship("PatientProfile", back_populates="user", uselist=False, lazy="selectin", cascade="all, delete-orphan")
+    researcher_profile = relationship("ResearcherProfile", back_populates="user", uselist=False, lazy="selectin", cascade="all, delete-orphan")
     favorites = relationship("Favorite", back_populates="user", cascade="all, delete-orphan")
 
 # Patient Profile Table
 class PatientProfile(Base):
     __tablename__ = "patient_profiles"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    user_id = Column(String, ForeignKey("users.id"), unique=True, nullable=False)
+    __table_args__ = (
+        # GIN index so condition filters (@>, &&, ANY) avoid a seq scan
+        Index("ix_patient_profiles_conditions_gin", "conditions", postgresql_using="gin"),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
     conditions = Column(ARRAY(String), default=[])
     symptoms = Column(Text)
-    location_city = Column(String)
-    location_country = Column(String)
+    location_city = Column(String(128))
+    location_country = Column(String(128))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="patient_profile")
@@ -65,97 +83,166 @@ class PatientProfile(Base):
 # Researcher Profile Table
 class ResearcherProfile(Base):
     __tablename__ = "researcher_profiles"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    user_id = Column(String, ForeignKey("users.id"), unique=True, nullable=False)
-    name = Column(String, nullable=False)
+    __table_args__ = (
+        Index("ix_researcher_profiles_specialties_gin", "specialties", postgresql_using="gin"),
+        Index("ix_researcher_profiles_interests_gin", "research_interests", postgresql_using="gin"),
+        Index("ix_researcher_profiles_created_id", "created_at", "id"),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
+    name = Column(String(255), nullable=False)
     specialties = Column(ARRAY(String), default=[])
     research_interests = Column(ARRAY(String), default=[])
-    orcid_id = Column(String)
-    researchgate_url = Column(String)
+    orcid_id = Column(String(19))
+    researchgate_url = Column(String(255))
     available_for_meetings = Column(Boolean, default=False)
     bio = Column(Text)
-    institution = Column(String)
+    institution = Column(String(255))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="researcher_profile")
+    # no response schema references these; queries that do need them
+    # should attach selectinload() per-query rather than paying two
+    # IN-queries on every researcher fetch
     publications = relationship("Publication", back_populates="researcher", cascade="all, delete-orphan")
     clinical_trials = relationship("ClinicalTrial", back_populates="researcher", cascade="all, delete-orphan")
 
 # Clinical Trials Table
 class ClinicalTrial(Base):
     __tablename__ = "clinical_trials"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    nct_id = Column(String, unique=True, index=True)
-    researcher_id = Column(String, ForeignKey("researcher_profiles.id"), nullable=True)
-    title = Column(String, nullable=False)
-    description = Column(Text)
-    condition = Column(String, nullable=False)
-    phase = Column(String)
-    status = Column(SQLEnum(TrialStatus), default=TrialStatus.RECRUITING)
-    location = Column(String)
-    eligibility = Column(Text)
-    contact_email = Column(String)
+    __table_args__ = (
+        # covers condition/status filters ordered by recency; INCLUDE lets
+        # title-only list views resolve with an index-only scan
+        Index(
+            "ix_trials_condition_status_created",
+            "condition", "status", "created_at",
+            postgresql_include=["title"],
+        ),
+        # pagination-by-modification for ingest syncs and feeds
+        Index("ix_trials_updated_at", "updated_at"),
+        # inverted index over the generated tsvector for keyword search
+        Index("ix_trials_search_tsv", "search_tsv", postgresql_using="gin"),
+        # keyset pagination seeks on this pair; a backward btree scan
+        # serves the (created_at DESC, id DESC) ordering
+        Index("ix_trials_created_id", "created_at", "id"),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    nct_id = Column(String(11), unique=True, index=True)
+    researcher_id = Column(UUID(as_uuid=True), ForeignKey("researcher_profiles.id"), nullable=True)
+    title = Column(String(500), nullable=False)
+    # multi-KB blobs: only fetched when a query undefers the 'detail' group
+    description = deferred(Column(Text), group="detail")
+    condition = Column(String(255), nullable=False)
+    phase = Column(String(16))
+    status = Column(trial_status_enum, default=TrialStatus.RECRUITING)
+    location = Column(String(255))
+    eligibility = deferred(Column(Text), group="detail")
+    contact_email = Column(String(254))
     start_date = Column(DateTime(timezone=True))
     completion_date = Column(DateTime(timezone=True))
-    ai_summary = Column(Text)
+    ai_summary = deferred(Column(Text), group="detail")
+    # Postgres maintains this tsvector on write; queries never pay
+    # to_tsvector() per row and the GIN index above makes keyword search
+    # an inverted-index lookup instead of a seq scan over ilike patterns
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(description, ''))",
+            persisted=True,
+        ),
+    ))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
     # Relationships
     researcher = relationship("ResearcherProfile", back_populates="clinical_trials")
 
 # Publications Table
 class Publication(Base):
     __tablename__ = "publications"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    researcher_id = Column(String, ForeignKey("researcher_profiles.id"), nullable=True)
-    pubmed_id = Column(String, unique=True, index=True, nullable=True)
-    title = Column(String, nullable=False)
+    __table_args__ = (
+        Index("ix_publications_authors_gin", "authors", postgresql_using="gin"),
+        Index("ix_publications_keywords_gin", "keywords", postgresql_using="gin"),
+        Index("ix_publications_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index("ix_publications_created_id", "created_at", "id"),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    researcher_id = Column(UUID(as_uuid=True), ForeignKey("researcher_profiles.id"), nullable=True)
+    pubmed_id = Column(String(16), unique=True, index=True, nullable=True)
+    title = Column(String(500), nullable=False)
     authors = Column(ARRAY(String), default=[])
-    journal = Column(String)
+    journal = Column(String(255))
     publication_date = Column(DateTime(timezone=True))
-    abstract = Column(Text)
-    doi = Column(String)
-    url = Column(String)
+    abstract = deferred(Column(Text), group="detail")
+    doi = Column(String(255))
+    url = Column(String(2048))
     keywords = Column(ARRAY(String), default=[])
-    ai_summary = Column(Text)
+    ai_summary = deferred(Column(Text), group="detail")
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(abstract, ''))",
+            persisted=True,
+        ),
+    ))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
     # Relationships
     researcher = relationship("ResearcherProfile", back_populates="publications")
 
 # Health Experts Table
 class HealthExpert(Base):
     __tablename__ = "health_experts"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    name = Column(String, nullable=False)
+    __table_args__ = (
+        Index("ix_health_experts_specialties_gin", "specialties", postgresql_using="gin"),
+        # jsonb_path_ops: smaller index, accelerates @> containment filters
+        Index(
+            "ix_health_experts_external_gin",
+            "external_data",
+            postgresql_using="gin",
+            postgresql_ops={"external_data": "jsonb_path_ops"},
+        ),
+        Index("ix_health_experts_created_id", "created_at", "id"),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name = Column(String(255), nullable=False)
     specialties = Column(ARRAY(String), default=[])
     research_interests = Column(ARRAY(String), default=[])
-    location_city = Column(String)
-    location_country = Column(String)
+    location_city = Column(String(128))
+    location_country = Column(String(128))
     is_registered = Column(Boolean, default=False)
-    contact_email = Column(String)
-    ai_summary = Column(Text)
-    external_data = Column(JSON)
+    contact_email = Column(String(254))
+    ai_summary = deferred(Column(Text), group="detail")
+    external_data = Column(JSONB)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
 # Forum Categories Table
 class ForumCategory(Base):
     __tablename__ = "forum_categories"
     
-    id = Column(String, primary_key=True, default=generate_uuid)
-    name = Column(String, nullable=False, unique=True)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name = Column(String(255), nullable=False, unique=True)
     description = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     posts = relationship("ForumPost", back_populates="category", cascade="all, delete-orphan")
@@ -163,68 +250,91 @@ class ForumCategory(Base):
 # Forum Posts Table
 class ForumPost(Base):
     __tablename__ = "forum_posts"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    category_id = Column(String, ForeignKey("forum_categories.id"), nullable=False)
-    author_id = Column(String, ForeignKey("users.id"), nullable=False)
-    author_type = Column(SQLEnum(UserType), nullable=False)
-    title = Column(String, nullable=False)
-    content = Column(Text, nullable=False)
+    __table_args__ = (
+        Index("ix_forum_posts_category_created", "category_id", "created_at"),
+        Index("ix_forum_posts_author_created", "author_id", "created_at"),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    category_id = Column(UUID(as_uuid=True), ForeignKey("forum_categories.id"), nullable=False)
+    author_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    title = Column(String(500), nullable=False)
+    content = deferred(Column(Text, nullable=False), group="detail")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    category = relationship("ForumCategory", back_populates="posts")
+    category = relationship("ForumCategory", back_populates="posts", lazy="selectin")
+    # replaces the denormalized author_type column: post.author.user_type
+    author = relationship("User", lazy="joined")
     replies = relationship("ForumReply", back_populates="post", cascade="all, delete-orphan")
 
 # Forum Replies Table
 class ForumReply(Base):
     __tablename__ = "forum_replies"
     
-    id = Column(String, primary_key=True, default=generate_uuid)
-    post_id = Column(String, ForeignKey("forum_posts.id"), nullable=False)
-    author_id = Column(String, ForeignKey("users.id"), nullable=False)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    post_id = Column(UUID(as_uuid=True), ForeignKey("forum_posts.id"), nullable=False)
+    author_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    post = relationship("ForumPost", back_populates="replies")
+    # joined: replies are loaded one-at-a-time, so a single JOIN beats selectin
+    post = relationship("ForumPost", back_populates="replies", lazy="joined")
 
 # Favorites Table
 class Favorite(Base):
     __tablename__ = "favorites"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    item_type = Column(SQLEnum(ItemType), nullable=False)
-    item_id = Column(String, nullable=False)
+    __table_args__ = (
+        # one row per (user, item); also serves the existence probe in add_favorite
+        Index("ix_favorites_user_item", "user_id", "item_type", "item_id", unique=True),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    item_type = Column(item_type_enum, nullable=False)
+    item_id = Column(UUID(as_uuid=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
-    user = relationship("User", back_populates="favorites")
+    user = relationship("User", back_populates="favorites", lazy="joined")
 
 # Meeting Requests Table
 class MeetingRequest(Base):
     __tablename__ = "meeting_requests"
-    
-    id = Column(String, primary_key=True, default=generate_uuid)
-    patient_id = Column(String, ForeignKey("users.id"), nullable=False)
-    expert_id = Column(String, nullable=False)
-    status = Column(SQLEnum(RequestStatus), default=RequestStatus.PENDING)
+    __table_args__ = (
+        Index("ix_meeting_requests_expert_status", "expert_id", "status"),
+    )
+
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    patient_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    expert_id = Column(UUID(as_uuid=True), nullable=False)
+    status = Column(request_status_enum, default=RequestStatus.PENDING)
     message = Column(Text)
-    patient_name = Column(String, nullable=False)
-    patient_contact = Column(String, nullable=False)
+    patient_name = Column(String(255), nullable=False)
+    patient_contact = Column(String(255), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
 # Connections Table (for researchers)
 class Connection(Base):
     __tablename__ = "connections"
     
-    id = Column(String, primary_key=True, default=generate_uuid)
-    requester_id = Column(String, ForeignKey("users.id"), nullable=False)
-    receiver_id = Column(String, ForeignKey("users.id"), nullable=False)
-    status = Column(SQLEnum(RequestStatus), default=RequestStatus.PENDING)
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    requester_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    receiver_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    status = Column(request_status_enum, default=RequestStatus.PENDING)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
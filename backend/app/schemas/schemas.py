@@ -1,6 +1,7 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
+from uuid import UUID
 from enum import Enum
 
 
@@ -9,6 +10,20 @@ class UserType(str, Enum):
     RESEARCHER = "researcher"
 
 
+class TrialStatus(str, Enum):
+    RECRUITING = "recruiting"
+    COMPLETED = "completed"
+    ACTIVE = "active"
+    SUSPENDED = "suspended"
+
+
+class ItemType(str, Enum):
+    TRIAL = "trial"
+    PUBLICATION = "publication"
+    EXPERT = "expert"
+    COLLABORATOR = "collaborator"
+
+
 # User Schemas
 class UserBase(BaseModel):
     email: EmailStr
@@ -20,12 +35,10 @@ class UserCreate(UserBase):
 
 
 class User(UserBase):
-    id: int
-    is_active: bool
+    id: UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
@@ -36,12 +49,10 @@ class Token(BaseModel):
 
 # Patient Profile Schemas
 class PatientProfileBase(BaseModel):
-    full_name: Optional[str] = None
     conditions: Optional[List[str]] = []
-    location: Optional[str] = None
-    age: Optional[int] = None
-    gender: Optional[str] = None
-    additional_info: Optional[str] = None
+    symptoms: Optional[str] = None
+    location_city: Optional[str] = None
+    location_country: Optional[str] = None
 
 
 class PatientProfileCreate(PatientProfileBase):
@@ -49,25 +60,23 @@ class PatientProfileCreate(PatientProfileBase):
 
 
 class PatientProfile(PatientProfileBase):
-    id: int
-    user_id: int
+    id: UUID
+    user_id: UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Researcher Profile Schemas
 class ResearcherProfileBase(BaseModel):
-    full_name: Optional[str] = None
-    institution: Optional[str] = None
+    name: str
     specialties: Optional[List[str]] = []
     research_interests: Optional[List[str]] = []
-    orcid: Optional[str] = None
+    orcid_id: Optional[str] = Field(None, max_length=19)
     researchgate_url: Optional[str] = None
     bio: Optional[str] = None
-    location: Optional[str] = None
-    available_for_meetings: bool = True
+    institution: Optional[str] = None
+    available_for_meetings: bool = False
 
 
 class ResearcherProfileCreate(ResearcherProfileBase):
@@ -75,83 +84,102 @@ class ResearcherProfileCreate(ResearcherProfileBase):
 
 
 class ResearcherProfile(ResearcherProfileBase):
-    id: int
-    user_id: int
+    id: UUID
+    user_id: UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Clinical Trial Schemas
 class ClinicalTrialBase(BaseModel):
-    title: str
+    title: str = Field(max_length=500)
     description: Optional[str] = None
-    status: Optional[str] = None
+    condition: str
     phase: Optional[str] = None
-    conditions: Optional[List[str]] = []
+    status: Optional[str] = None
+    location: Optional[str] = None
     eligibility: Optional[str] = None
-    locations: Optional[List[str]] = []
     contact_email: Optional[str] = None
-    contact_phone: Optional[str] = None
     start_date: Optional[datetime] = None
     completion_date: Optional[datetime] = None
-    enrollment: Optional[int] = None
-    url: Optional[str] = None
 
 
 class ClinicalTrialCreate(ClinicalTrialBase):
-    id: str  # NCT ID
+    nct_id: Optional[str] = Field(None, max_length=11)  # ClinicalTrials.gov ID
 
 
 class ClinicalTrial(ClinicalTrialBase):
-    id: str
-    source: str
+    id: UUID
+    nct_id: Optional[str] = None
     ai_summary: Optional[str] = None
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ClinicalTrialListItem(BaseModel):
+    """Lean row for list/search responses; the Text blobs and AI summary
+    stay in the database until the detail endpoint asks for them."""
+    id: UUID
+    nct_id: Optional[str] = None
+    title: str
+    condition: str
+    phase: Optional[str] = None
+    status: Optional[str] = None
+    location: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Publication Schemas
 class PublicationBase(BaseModel):
-    title: str
+    title: str = Field(max_length=500)
     authors: Optional[List[str]] = []
     abstract: Optional[str] = None
     journal: Optional[str] = None
     publication_date: Optional[datetime] = None
-    doi: Optional[str] = None
-    pmid: Optional[str] = None
+    doi: Optional[str] = Field(None, max_length=255)
     url: Optional[str] = None
     keywords: Optional[List[str]] = []
-    conditions: Optional[List[str]] = []
 
 
 class PublicationCreate(PublicationBase):
-    id: str
+    pubmed_id: Optional[str] = Field(None, max_length=16)
 
 
 class Publication(PublicationBase):
-    id: str
+    id: UUID
+    pubmed_id: Optional[str] = None
     ai_summary: Optional[str] = None
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PublicationListItem(BaseModel):
+    id: UUID
+    pubmed_id: Optional[str] = None
+    title: str
+    authors: Optional[List[str]] = []
+    journal: Optional[str] = None
+    publication_date: Optional[datetime] = None
+    doi: Optional[str] = None
+    url: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Health Expert Schemas
 class HealthExpertBase(BaseModel):
-    full_name: str
+    name: str
     specialties: Optional[List[str]] = []
-    institution: Optional[str] = None
-    location: Optional[str] = None
-    email: Optional[str] = None
-    phone: Optional[str] = None
-    bio: Optional[str] = None
     research_interests: Optional[List[str]] = []
-    orcid: Optional[str] = None
+    location_city: Optional[str] = None
+    location_country: Optional[str] = None
+    contact_email: Optional[str] = None
 
 
 class HealthExpertCreate(HealthExpertBase):
@@ -159,20 +187,28 @@ class HealthExpertCreate(HealthExpertBase):
 
 
 class HealthExpert(HealthExpertBase):
-    id: int
-    is_platform_member: bool
-    publications_count: int
+    id: UUID
+    is_registered: bool
+    ai_summary: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HealthExpertListItem(HealthExpertBase):
+    """Lean row for list/search responses; the deferred AI summary stays
+    in the database until the detail view asks for it."""
+    id: UUID
+    is_registered: bool
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Favorite Schemas
 class FavoriteBase(BaseModel):
-    favorite_type: str
-    favorite_id: str
-    notes: Optional[str] = None
+    item_type: ItemType
+    item_id: UUID
 
 
 class FavoriteCreate(FavoriteBase):
@@ -180,40 +216,35 @@ class FavoriteCreate(FavoriteBase):
 
 
 class Favorite(FavoriteBase):
-    id: int
-    user_id: int
+    id: UUID
+    user_id: UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
-# Forum Schemas
-class ForumBase(BaseModel):
+# Forum Category Schemas
+class ForumCategoryBase(BaseModel):
     name: str
     description: Optional[str] = None
-    category: Optional[str] = None
 
 
-class ForumCreate(ForumBase):
+class ForumCategoryCreate(ForumCategoryBase):
     pass
 
 
-class Forum(ForumBase):
-    id: int
-    created_by: int
-    is_active: bool
+class ForumCategory(ForumCategoryBase):
+    id: UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Forum Post Schemas
 class ForumPostBase(BaseModel):
-    title: str
+    title: str = Field(max_length=500)
     content: str
-    forum_id: int
+    category_id: UUID
 
 
 class ForumPostCreate(ForumPostBase):
@@ -221,18 +252,17 @@ class ForumPostCreate(ForumPostBase):
 
 
 class ForumPost(ForumPostBase):
-    id: int
-    user_id: int
+    id: UUID
+    author_id: UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Forum Reply Schemas
 class ForumReplyBase(BaseModel):
     content: str
-    post_id: int
+    post_id: UUID
 
 
 class ForumReplyCreate(ForumReplyBase):
@@ -240,19 +270,19 @@ class ForumReplyCreate(ForumReplyBase):
 
 
 class ForumReply(ForumReplyBase):
-    id: int
-    user_id: int
+    id: UUID
+    author_id: UUID
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Meeting Request Schemas
 class MeetingRequestBase(BaseModel):
-    expert_id: int
+    expert_id: UUID
     message: Optional[str] = None
-    contact_info: dict
+    patient_name: str
+    patient_contact: str
 
 
 class MeetingRequestCreate(MeetingRequestBase):
@@ -260,10 +290,23 @@ class MeetingRequestCreate(MeetingRequestBase):
 
 
 class MeetingRequest(MeetingRequestBase):
-    id: int
-    requester_id: int
+    id: UUID
+    patient_id: UUID
     status: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Pre-built list adapters for batch response serialization: the validator
+# is compiled once at import and reused across every page of rows, instead
+# of validating items one at a time per request. Trials and publications
+# use the lean list-item schemas their list endpoints serve.
+UserListAdapter = TypeAdapter(List[User])
+ResearcherProfileListAdapter = TypeAdapter(List[ResearcherProfile])
+ClinicalTrialListAdapter = TypeAdapter(List[ClinicalTrialListItem])
+PublicationListAdapter = TypeAdapter(List[PublicationListItem])
+HealthExpertListAdapter = TypeAdapter(List[HealthExpertListItem])
+FavoriteListAdapter = TypeAdapter(List[Favorite])
+ForumCategoryListAdapter = TypeAdapter(List[ForumCategory])
+ForumPostListAdapter = TypeAdapter(List[ForumPost])
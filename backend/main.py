@@ -1,40 +1,59 @@
 """
 CuraLink FastAPI Main Application
 """
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import exists, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, undefer_group
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+from typing import Optional
+import asyncio
+import hashlib
+import os
 import uvicorn
 
 # Import configurations (you'll need to create these)
+from app.core.cache import response_cache
 from app.core.config import settings
-from app.db.session import get_db, engine
+from app.db.batch import InsertBatcher
+from app.db.session import async_engine, get_async_db, prewarm_pool
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    DUMMY_PASSWORD_HASH,
+    averify_password,
+    aget_password_hash,
     create_access_token,
     get_current_user,
-    get_current_active_user
+    get_current_active_user,
+    invalidate_user_cache,
+    password_needs_rehash,
+    rehash_and_store
 )
 import app.models.models as models
 import app.schemas.schemas as schemas
 
-# Create tables
-models.Base.metadata.create_all(bind=engine)
-
 # Initialize FastAPI
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
-    description="AI-powered platform connecting patients and researchers"
+    description="AI-powered platform connecting patients and researchers",
+    # orjson encodes datetimes/UUIDs natively in C, skipping the
+    # jsonable_encoder walk stdlib json needs for every response
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    allow_origins=list(settings.cors_origins_set),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -42,33 +61,144 @@ app.add_middleware(
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Per-IP token bucket for the endpoints that run a password hash: an
+# abusive client hammering login/register would otherwise saturate CPU.
+# Redis-backed so the limit holds across workers, and a 429 rejects
+# before any hashing work is done.
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.REDIS_URL)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+# Public, unauthenticated list GETs eligible for conditional requests
+_ETAG_TABLES = {
+    "/api/trials": "clinical_trials",
+    "/api/publications": "publications",
+    "/api/experts": "health_experts",
+}
+
+
+async def _table_last_updated(table: str) -> str:
+    """MAX(updated_at) for a table, held in Redis for 5s so the probe
+    itself costs one round-trip instead of a DB aggregate per request."""
+    key = f"lastmod:{table}"
+    cached = await response_cache.get(key)
+    if cached is not None:
+        return cached.decode()
+    async with async_engine.connect() as conn:
+        stamp = (await conn.execute(text(f"SELECT max(updated_at) FROM {table}"))).scalar()
+    value = stamp.isoformat() if stamp else ""
+    await response_cache.set(key, value.encode(), ttl=5)
+    return value
+
+
+@app.middleware("http")
+async def conditional_get_headers(request, call_next):
+    """Weak ETags over (path, query, table last-modified) for public list
+    GETs: a matching If-None-Match returns 304 before the query, ORM and
+    serialization run, and Cache-Control lets clients/CDNs reuse bodies."""
+    table = _ETAG_TABLES.get(request.url.path) if request.method == "GET" else None
+    if table is None:
+        return await call_next(request)
+
+    stamp = await _table_last_updated(table)
+    fingerprint = f"{request.url.path}?{request.url.query}:{stamp}"
+    etag = 'W/"' + hashlib.sha1(fingerprint.encode()).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=30"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
+
+
+# Write-back queues for the chatty forum inserts; one batched commit
+# replaces up to a hundred per-request fsyncs
+forum_post_batcher = InsertBatcher(models.ForumPost)
+forum_reply_batcher = InsertBatcher(models.ForumReply)
+
+
+@app.on_event("startup")
+async def warm_connection_pool():
+    await prewarm_pool()
+    forum_post_batcher.start()
+    forum_reply_batcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_write_batchers():
+    await forum_post_batcher.stop()
+    await forum_reply_batcher.stop()
+
+
+def guard_lazy_loads(stmt):
+    """In debug mode, make accidental relationship lazy-loads on list
+    queries raise instead of silently emitting N+1 SELECTs; anything a
+    response actually needs must be eager-loaded explicitly."""
+    if settings.DEBUG:
+        stmt = stmt.options(raiseload("*"))
+    return stmt
+
+
+def adapted(adapter, rows) -> ORJSONResponse:
+    """Render a list response through a module-level TypeAdapter.
+
+    The adapter's validator/serializer is compiled once at import;
+    building the ORJSONResponse here skips FastAPI's per-request
+    response-model re-validation of rows we just validated.
+    """
+    items = adapter.validate_python(rows, from_attributes=True)
+    return ORJSONResponse(adapter.dump_python(items, mode="json"))
+
+
+def paginate(stmt, model, after: Optional[str], skip: int, limit: int):
+    """Apply keyset pagination when an `after` cursor is given.
+
+    The cursor is `<created_at isoformat>_<id>` of the last row the
+    client saw (both fields appear in every list schema). Seeking on the
+    indexed (created_at, id) pair reads exactly `limit` rows however
+    deep the page; OFFSET still scans and discards `skip` rows, so it is
+    kept only as a back-compat fallback.
+    """
+    if after is not None:
+        ts, _, row_id = after.rpartition("_")
+        try:
+            cursor = (datetime.fromisoformat(ts), UUID(row_id))
+        except ValueError:
+            raise HTTPException(status_code=422, detail="Malformed cursor")
+        stmt = stmt.where(tuple_(model.created_at, model.id) < cursor)
+    elif skip:
+        stmt = stmt.offset(skip)
+    return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
+
 
 # ==================== AUTH ROUTES ====================
 @app.post("/api/auth/register", response_model=schemas.Token)
-def register(
+@limiter.limit("5/minute")
+async def register(
+    request: Request,
     user: schemas.UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Register a new user"""
-    # Check if user exists
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if db_user:
+    # Existence check only: SELECT EXISTS avoids hydrating a full User row
+    if await db.scalar(select(exists().where(models.User.email == user.email))):
         raise HTTPException(status_code=400, detail="Email already registered")
-    
+
     # Create user
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await aget_password_hash(user.password)
     db_user = models.User(
         email=user.email,
-        password_hash=hashed_password,
+        hashed_password=hashed_password,
         user_type=user.user_type
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-    
+    await db.commit()
+
     # Create access token
     access_token = create_access_token(data={"sub": db_user.email})
-    
+
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -77,18 +207,31 @@ def register(
 
 
 @app.post("/api/auth/login", response_model=schemas.Token)
-def login(
+@limiter.limit("5/minute")
+async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Login user"""
-    user = db.query(models.User).filter(models.User.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    user = (await db.execute(
+        select(models.User).where(models.User.email == form_data.username)
+    )).scalar_one_or_none()
+    # Always run a verify, against a dummy hash if the email is unknown,
+    # so rejection latency doesn't reveal whether the account exists
+    hashed = user.hashed_password if user else DUMMY_PASSWORD_HASH
+    password_ok = await averify_password(form_data.password, hashed)
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
-    
+
+    # Opportunistic upgrade: verified credentials stored under a
+    # deprecated scheme or lower cost get re-hashed off the request path
+    if password_needs_rehash(user.hashed_password):
+        asyncio.create_task(rehash_and_store(user.id, form_data.password))
+
     access_token = create_access_token(data={"sub": user.email})
     return {
         "access_token": access_token,
@@ -98,375 +241,464 @@ def login(
 
 
 @app.get("/api/auth/me", response_model=schemas.User)
-def get_current_user_info(current_user: models.User = Depends(get_current_active_user)):
+async def get_current_user_info(current_user: models.User = Depends(get_current_active_user)):
     """Get current user information"""
     return current_user
 
 
 # ==================== PATIENT ROUTES ====================
 @app.post("/api/patients/profile", response_model=schemas.PatientProfile)
-def create_patient_profile(
+async def create_patient_profile(
     profile: schemas.PatientProfileCreate,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create or update patient profile"""
     if current_user.user_type != schemas.UserType.PATIENT:
         raise HTTPException(status_code=403, detail="Only patients can create patient profiles")
-    
-    # Check if profile exists
-    db_profile = db.query(models.PatientProfile).filter(
-        models.PatientProfile.user_id == current_user.id
-    ).first()
-    
-    if db_profile:
-        # Update existing profile
-        for key, value in profile.dict().items():
-            setattr(db_profile, key, value)
-    else:
-        # Create new profile
-        db_profile = models.PatientProfile(**profile.dict(), user_id=current_user.id)
-        db.add(db_profile)
-    
-    db.commit()
-    db.refresh(db_profile)
+
+    # One atomic round-trip: the unique user_id index resolves
+    # create-vs-update server-side instead of a SELECT-then-write pair
+    values = profile.dict()
+    stmt = pg_insert(models.PatientProfile).values(**values, user_id=current_user.id)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={key: stmt.excluded[key] for key in values},
+    ).returning(models.PatientProfile)
+    db_profile = (await db.execute(stmt)).scalar_one()
+    await db.commit()
+    # the cached user row still carries the pre-write (possibly None)
+    # profile; drop it so the next request reloads
+    invalidate_user_cache(current_user.email)
     return db_profile
 
 
 @app.get("/api/patients/profile", response_model=schemas.PatientProfile)
-def get_patient_profile(
+async def get_patient_profile(
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get patient profile"""
-    profile = db.query(models.PatientProfile).filter(
-        models.PatientProfile.user_id == current_user.id
-    ).first()
-    
+    profile = (await db.execute(
+        select(models.PatientProfile).where(models.PatientProfile.user_id == current_user.id)
+    )).scalar_one_or_none()
+
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
-    
+
     return profile
 
 
 # ==================== RESEARCHER ROUTES ====================
 @app.post("/api/researchers/profile", response_model=schemas.ResearcherProfile)
-def create_researcher_profile(
+async def create_researcher_profile(
     profile: schemas.ResearcherProfileCreate,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create or update researcher profile"""
     if current_user.user_type != schemas.UserType.RESEARCHER:
         raise HTTPException(status_code=403, detail="Only researchers can create researcher profiles")
-    
-    db_profile = db.query(models.ResearcherProfile).filter(
-        models.ResearcherProfile.user_id == current_user.id
-    ).first()
-    
-    if db_profile:
-        for key, value in profile.dict().items():
-            setattr(db_profile, key, value)
-    else:
-        db_profile = models.ResearcherProfile(**profile.dict(), user_id=current_user.id)
-        db.add(db_profile)
-    
-    db.commit()
-    db.refresh(db_profile)
+
+    values = profile.dict()
+    stmt = pg_insert(models.ResearcherProfile).values(**values, user_id=current_user.id)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={key: stmt.excluded[key] for key in values},
+    ).returning(models.ResearcherProfile)
+    db_profile = (await db.execute(stmt)).scalar_one()
+    await db.commit()
+    invalidate_user_cache(current_user.email)
     return db_profile
 
 
 @app.get("/api/researchers/profile", response_model=schemas.ResearcherProfile)
-def get_researcher_profile(
+async def get_researcher_profile(
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get researcher profile"""
-    profile = db.query(models.ResearcherProfile).filter(
-        models.ResearcherProfile.user_id == current_user.id
-    ).first()
-    
+    profile = (await db.execute(
+        select(models.ResearcherProfile).where(models.ResearcherProfile.user_id == current_user.id)
+    )).scalar_one_or_none()
+
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
-    
+
     return profile
 
 
-@app.get("/api/researchers", response_model=List[schemas.ResearcherProfile])
-def search_researchers(
+@app.get("/api/researchers")
+async def search_researchers(
     specialty: Optional[str] = None,
+    after: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Search researchers (for collaborators)"""
-    query = db.query(models.ResearcherProfile)
-    
+    stmt = select(models.ResearcherProfile)
+
     if specialty:
-        query = query.filter(models.ResearcherProfile.specialties.contains([specialty]))
-    
-    researchers = query.offset(skip).limit(limit).all()
-    return researchers
+        stmt = stmt.where(models.ResearcherProfile.specialties.contains([specialty]))
+
+    stmt = paginate(guard_lazy_loads(stmt), models.ResearcherProfile, after, skip, limit)
+    result = await db.execute(stmt)
+    return adapted(schemas.ResearcherProfileListAdapter, result.scalars().all())
 
 
 # ==================== CLINICAL TRIALS ROUTES ====================
-@app.get("/api/trials", response_model=List[schemas.ClinicalTrial])
-def search_clinical_trials(
+@app.get("/api/trials")
+async def search_clinical_trials(
     keywords: Optional[str] = None,
-    status: Optional[str] = None,
+    # enum-typed so unknown values 422 instead of erroring inside
+    # Postgres against the native enum column
+    status: Optional[schemas.TrialStatus] = None,
     location: Optional[str] = None,
+    after: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Search clinical trials"""
-    query = db.query(models.ClinicalTrial)
-    
+    # column-only select: no ORM hydration and the deferred Text blobs
+    # never leave the database
+    stmt = select(
+        models.ClinicalTrial.id,
+        models.ClinicalTrial.nct_id,
+        models.ClinicalTrial.title,
+        models.ClinicalTrial.condition,
+        models.ClinicalTrial.phase,
+        models.ClinicalTrial.status,
+        models.ClinicalTrial.location,
+        models.ClinicalTrial.created_at,
+    )
+
     if keywords:
-        query = query.filter(
-            models.ClinicalTrial.title.ilike(f"%{keywords}%") |
-            models.ClinicalTrial.description.ilike(f"%{keywords}%")
+        # full-text search over the indexed generated tsvector; a
+        # leading-wildcard ilike would force a seq scan per request
+        stmt = stmt.where(
+            models.ClinicalTrial.search_tsv.op("@@")(
+                func.plainto_tsquery("english", keywords)
+            )
         )
-    
+
     if status:
-        query = query.filter(models.ClinicalTrial.status == status)
-    
+        stmt = stmt.where(models.ClinicalTrial.status == status)
+
     if location:
-        query = query.filter(models.ClinicalTrial.locations.contains([location]))
-    
-    trials = query.offset(skip).limit(limit).all()
-    return trials
+        stmt = stmt.where(models.ClinicalTrial.location.ilike(f"%{location}%"))
+
+    result = await db.execute(paginate(stmt, models.ClinicalTrial, after, skip, limit))
+    return adapted(schemas.ClinicalTrialListAdapter, result.mappings().all())
 
 
 @app.post("/api/trials", response_model=schemas.ClinicalTrial)
-def create_clinical_trial(
+async def create_clinical_trial(
     trial: schemas.ClinicalTrialCreate,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a clinical trial (researchers only)"""
     if current_user.user_type != schemas.UserType.RESEARCHER:
         raise HTTPException(status_code=403, detail="Only researchers can create trials")
-    
-    db_trial = models.ClinicalTrial(**trial.dict(), created_by=current_user.id)
+
+    researcher = current_user.researcher_profile
+    db_trial = models.ClinicalTrial(
+        **trial.dict(),
+        researcher_id=researcher.id if researcher else None,
+        # explicit so the deferred column counts as loaded; response
+        # serialization would otherwise lazy-load it (MissingGreenlet
+        # on an AsyncSession)
+        ai_summary=None,
+    )
     db.add(db_trial)
-    db.commit()
-    db.refresh(db_trial)
+    await db.commit()
+    await response_cache.invalidate(f"trial:{db_trial.id}")
     return db_trial
 
 
 @app.get("/api/trials/{trial_id}", response_model=schemas.ClinicalTrial)
-def get_clinical_trial(trial_id: str, db: Session = Depends(get_db)):
+async def get_clinical_trial(trial_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """Get a specific clinical trial"""
-    trial = db.query(models.ClinicalTrial).filter(models.ClinicalTrial.id == trial_id).first()
+    cache_key = f"trial:{trial_id}"
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    trial = (await db.execute(
+        select(models.ClinicalTrial)
+        .options(undefer_group("detail"))
+        .where(models.ClinicalTrial.id == trial_id)
+    )).scalar_one_or_none()
     if not trial:
         raise HTTPException(status_code=404, detail="Trial not found")
-    return trial
+
+    payload = schemas.ClinicalTrial.model_validate(trial).model_dump_json()
+    await response_cache.set(cache_key, payload.encode())
+    return Response(content=payload, media_type="application/json")
 
 
 # ==================== PUBLICATIONS ROUTES ====================
-@app.get("/api/publications", response_model=List[schemas.Publication])
-def search_publications(
+@app.get("/api/publications")
+async def search_publications(
     keywords: Optional[str] = None,
+    after: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Search publications"""
-    query = db.query(models.Publication)
-    
+    stmt = select(
+        models.Publication.id,
+        models.Publication.pubmed_id,
+        models.Publication.title,
+        models.Publication.authors,
+        models.Publication.journal,
+        models.Publication.publication_date,
+        models.Publication.doi,
+        models.Publication.url,
+        models.Publication.created_at,
+    )
+
     if keywords:
-        query = query.filter(
-            models.Publication.title.ilike(f"%{keywords}%") |
-            models.Publication.abstract.ilike(f"%{keywords}%")
+        stmt = stmt.where(
+            models.Publication.search_tsv.op("@@")(
+                func.plainto_tsquery("english", keywords)
+            )
         )
-    
-    publications = query.offset(skip).limit(limit).all()
-    return publications
+
+    result = await db.execute(paginate(stmt, models.Publication, after, skip, limit))
+    return adapted(schemas.PublicationListAdapter, result.mappings().all())
 
 
 @app.get("/api/publications/{publication_id}", response_model=schemas.Publication)
-def get_publication(publication_id: str, db: Session = Depends(get_db)):
+async def get_publication(publication_id: UUID, db: AsyncSession = Depends(get_async_db)):
     """Get a specific publication"""
-    pub = db.query(models.Publication).filter(models.Publication.id == publication_id).first()
+    cache_key = f"publication:{publication_id}"
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    pub = (await db.execute(
+        select(models.Publication)
+        .options(undefer_group("detail"))
+        .where(models.Publication.id == publication_id)
+    )).scalar_one_or_none()
     if not pub:
         raise HTTPException(status_code=404, detail="Publication not found")
-    return pub
+
+    payload = schemas.Publication.model_validate(pub).model_dump_json()
+    await response_cache.set(cache_key, payload.encode())
+    return Response(content=payload, media_type="application/json")
 
 
 # ==================== HEALTH EXPERTS ROUTES ====================
-@app.get("/api/experts", response_model=List[schemas.HealthExpert])
-def search_health_experts(
+@app.get("/api/experts")
+async def search_health_experts(
     specialty: Optional[str] = None,
     location: Optional[str] = None,
+    after: Optional[str] = None,
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Search health experts"""
-    query = db.query(models.HealthExpert)
-    
+    # column-only select: the deferred ai_summary blob never loads, and
+    # serializing a full ORM row would lazy-load it (MissingGreenlet on
+    # an AsyncSession)
+    stmt = select(
+        models.HealthExpert.id,
+        models.HealthExpert.name,
+        models.HealthExpert.specialties,
+        models.HealthExpert.research_interests,
+        models.HealthExpert.location_city,
+        models.HealthExpert.location_country,
+        models.HealthExpert.contact_email,
+        models.HealthExpert.is_registered,
+        models.HealthExpert.created_at,
+    )
+
     if specialty:
-        query = query.filter(models.HealthExpert.specialties.contains([specialty]))
-    
+        stmt = stmt.where(models.HealthExpert.specialties.contains([specialty]))
+
     if location:
-        query = query.filter(models.HealthExpert.location.ilike(f"%{location}%"))
-    
-    experts = query.offset(skip).limit(limit).all()
-    return experts
+        stmt = stmt.where(
+            models.HealthExpert.location_city.ilike(f"%{location}%") |
+            models.HealthExpert.location_country.ilike(f"%{location}%")
+        )
+
+    result = await db.execute(paginate(stmt, models.HealthExpert, after, skip, limit))
+    return adapted(schemas.HealthExpertListAdapter, result.mappings().all())
 
 
 # ==================== FAVORITES ROUTES ====================
 @app.post("/api/favorites", response_model=schemas.Favorite)
-def add_favorite(
+async def add_favorite(
     favorite: schemas.FavoriteCreate,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Add to favorites"""
-    # Check if already favorited
-    existing = db.query(models.Favorite).filter(
-        models.Favorite.user_id == current_user.id,
-        models.Favorite.favorite_type == favorite.favorite_type,
-        models.Favorite.favorite_id == favorite.favorite_id
-    ).first()
-    
-    if existing:
-        raise HTTPException(status_code=400, detail="Already favorited")
-    
-    db_favorite = models.Favorite(
-        **favorite.dict(),
-        user_id=current_user.id
+    # Single round-trip: the unique (user_id, item_type, item_id) index
+    # dedupes server-side, so there is no check-then-insert race.
+    stmt = (
+        pg_insert(models.Favorite)
+        .values(**favorite.dict(), user_id=current_user.id)
+        .on_conflict_do_nothing(
+            index_elements=["user_id", "item_type", "item_id"]
+        )
+        .returning(models.Favorite)
     )
-    db.add(db_favorite)
-    db.commit()
-    db.refresh(db_favorite)
+    db_favorite = (await db.execute(stmt)).scalar_one_or_none()
+    if db_favorite is None:
+        raise HTTPException(status_code=400, detail="Already favorited")
+    await db.commit()
     return db_favorite
 
 
-@app.get("/api/favorites", response_model=List[schemas.Favorite])
-def get_favorites(
-    favorite_type: Optional[str] = None,
+@app.get("/api/favorites")
+async def get_favorites(
+    item_type: Optional[schemas.ItemType] = None,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get user's favorites"""
-    query = db.query(models.Favorite).filter(models.Favorite.user_id == current_user.id)
-    
-    if favorite_type:
-        query = query.filter(models.Favorite.favorite_type == favorite_type)
-    
-    return query.all()
+    stmt = select(models.Favorite).where(models.Favorite.user_id == current_user.id)
+
+    if item_type:
+        stmt = stmt.where(models.Favorite.item_type == item_type)
+
+    result = await db.execute(guard_lazy_loads(stmt))
+    return adapted(schemas.FavoriteListAdapter, result.scalars().all())
 
 
 @app.delete("/api/favorites/{favorite_id}")
-def remove_favorite(
-    favorite_id: str,
+async def remove_favorite(
+    favorite_id: UUID,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Remove from favorites"""
-    favorite = db.query(models.Favorite).filter(
-        models.Favorite.id == favorite_id,
-        models.Favorite.user_id == current_user.id
-    ).first()
-    
+    favorite = (await db.execute(
+        select(models.Favorite).where(
+            models.Favorite.id == favorite_id,
+            models.Favorite.user_id == current_user.id
+        )
+    )).scalar_one_or_none()
+
     if not favorite:
         raise HTTPException(status_code=404, detail="Favorite not found")
-    
-    db.delete(favorite)
-    db.commit()
+
+    await db.delete(favorite)
+    await db.commit()
     return {"message": "Removed from favorites"}
 
 
 # ==================== FORUMS ROUTES ====================
-@app.get("/api/forums", response_model=List[schemas.Forum])
-def get_forums(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
+@app.get("/api/forums")
+async def get_forums(
+    after: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get all forums"""
-    return db.query(models.Forum).offset(skip).limit(limit).all()
+    stmt = paginate(
+        guard_lazy_loads(select(models.ForumCategory)),
+        models.ForumCategory, after, skip, limit,
+    )
+    result = await db.execute(stmt)
+    return adapted(schemas.ForumCategoryListAdapter, result.scalars().all())
 
 
-@app.post("/api/forums", response_model=schemas.Forum)
-def create_forum(
-    forum: schemas.ForumCreate,
+@app.post("/api/forums", response_model=schemas.ForumCategory)
+async def create_forum(
+    forum: schemas.ForumCategoryCreate,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a forum (researchers only)"""
     if current_user.user_type != schemas.UserType.RESEARCHER:
         raise HTTPException(status_code=403, detail="Only researchers can create forums")
-    
-    db_forum = models.Forum(**forum.dict(), created_by=current_user.id)
+
+    db_forum = models.ForumCategory(**forum.dict())
     db.add(db_forum)
-    db.commit()
-    db.refresh(db_forum)
+    await db.commit()
     return db_forum
 
 
-@app.get("/api/forums/{forum_id}/posts", response_model=List[schemas.ForumPost])
-def get_forum_posts(forum_id: str, skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
+@app.get("/api/forums/{forum_id}/posts")
+async def get_forum_posts(forum_id: UUID, skip: int = 0, limit: int = 20, db: AsyncSession = Depends(get_async_db)):
     """Get posts in a forum"""
-    return db.query(models.ForumPost).filter(
-        models.ForumPost.forum_id == forum_id
-    ).offset(skip).limit(limit).all()
+    result = await db.execute(
+        guard_lazy_loads(
+            select(models.ForumPost)
+            .options(undefer_group("detail"))
+            .where(models.ForumPost.category_id == forum_id)
+        ).offset(skip).limit(limit)
+    )
+    return adapted(schemas.ForumPostListAdapter, result.scalars().all())
 
 
 @app.post("/api/forums/posts", response_model=schemas.ForumPost)
-def create_forum_post(
+async def create_forum_post(
     post: schemas.ForumPostCreate,
-    current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_active_user)
 ):
     """Create a forum post"""
-    db_post = models.ForumPost(**post.dict(), user_id=current_user.id)
-    db.add(db_post)
-    db.commit()
-    db.refresh(db_post)
-    return db_post
+    return await forum_post_batcher.insert({**post.dict(), "author_id": current_user.id})
 
 
 @app.post("/api/forums/replies", response_model=schemas.ForumReply)
-def create_forum_reply(
+async def create_forum_reply(
     reply: schemas.ForumReplyCreate,
-    current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_active_user)
 ):
     """Reply to a forum post (researchers only)"""
     if current_user.user_type != schemas.UserType.RESEARCHER:
         raise HTTPException(status_code=403, detail="Only researchers can reply")
-    
-    db_reply = models.ForumReply(**reply.dict(), user_id=current_user.id)
-    db.add(db_reply)
-    db.commit()
-    db.refresh(db_reply)
-    return db_reply
+
+    return await forum_reply_batcher.insert({**reply.dict(), "author_id": current_user.id})
 
 
 # ==================== MEETING REQUESTS ====================
 @app.post("/api/meeting-requests", response_model=schemas.MeetingRequest)
-def create_meeting_request(
+async def create_meeting_request(
     request: schemas.MeetingRequestCreate,
     current_user: models.User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Request a meeting with an expert"""
-    db_request = models.MeetingRequest(**request.dict(), requester_id=current_user.id)
+    db_request = models.MeetingRequest(**request.dict(), patient_id=current_user.id)
     db.add(db_request)
-    db.commit()
-    db.refresh(db_request)
+    await db.commit()
     return db_request
 
 
 # ==================== HEALTH CHECK ====================
 @app.get("/")
-def root():
+async def root():
     return {"message": "CuraLink API is running", "version": settings.VERSION}
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "healthy"}
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    if settings.DEBUG:
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # uvloop + httptools (bundled with uvicorn[standard]) replace the
+        # stock event loop and h11 parser; one worker per core
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=int(os.getenv("UVICORN_WORKERS", str(os.cpu_count() or 4))),
+            loop="uvloop",
+            http="httptools",
+            log_level="warning",
+        )